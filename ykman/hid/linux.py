@@ -62,11 +62,13 @@ class HidrawConnection(OtpConnection):
         buf = bytearray(1 + 8)
         fcntl.ioctl(self.handle, USB_GET_REPORT, buf, True)
         data = buf[1:]
-        logger.log(LOG_LEVEL.TRAFFIC, "RECV: %s", data.hex())
+        if logger.isEnabledFor(LOG_LEVEL.TRAFFIC):
+            logger.log(LOG_LEVEL.TRAFFIC, "RECV: %s", data.hex())
         return data
 
     def send(self, data):
-        logger.log(LOG_LEVEL.TRAFFIC, "SEND: %s", data.hex())
+        if logger.isEnabledFor(LOG_LEVEL.TRAFFIC):
+            logger.log(LOG_LEVEL.TRAFFIC, "SEND: %s", data.hex())
         buf = bytearray([0])  # Prepend the report ID.
         buf.extend(data)
         fcntl.ioctl(self.handle, USB_SET_REPORT, buf, True)
@@ -207,11 +207,13 @@ class MacHidOtpConnection(OtpConnection):
             raise OSError(f"Failed to read report from device: {result}")
 
         data = buf.raw[:]
-        logger.log(LOG_LEVEL.TRAFFIC, "RECV: %s", data.hex())
+        if logger.isEnabledFor(LOG_LEVEL.TRAFFIC):
+            logger.log(LOG_LEVEL.TRAFFIC, "RECV: %s", data.hex())
         return data
 
     def send(self, data):
-        logger.log(LOG_LEVEL.TRAFFIC, "SEND: %s", data.hex())
+        if logger.isEnabledFor(LOG_LEVEL.TRAFFIC):
+            logger.log(LOG_LEVEL.TRAFFIC, "SEND: %s", data.hex())
         result = iokit.IOHIDDeviceSetReport(
             self.handle,
             K_IO_HID_REPORT_TYPE_FEATURE,
@@ -211,11 +211,13 @@ class WinHidOtpConnection(OtpConnection):
         if not result:
             raise WinError()
         data = buf.raw[1:]
-        logger.log(LOG_LEVEL.TRAFFIC, "RECV: %s", data.hex())
+        if logger.isEnabledFor(LOG_LEVEL.TRAFFIC):
+            logger.log(LOG_LEVEL.TRAFFIC, "RECV: %s", data.hex())
         return data
 
     def send(self, data):
-        logger.log(LOG_LEVEL.TRAFFIC, "SEND: %s", data.hex())
+        if logger.isEnabledFor(LOG_LEVEL.TRAFFIC):
+            logger.log(LOG_LEVEL.TRAFFIC, "SEND: %s", data.hex())
         buf = ctypes.create_string_buffer(b"\0" + data)
         result = hid.HidD_SetFeature(self.handle, buf, ctypes.sizeof(buf))
         if not result:
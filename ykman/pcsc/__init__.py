@@ -118,11 +118,13 @@ class ScardSmartCardConnection(SmartCardConnection):
 
     def send_and_receive(self, apdu):
         """Sends a command APDU and returns the response data and sw"""
-        logger.log(LOG_LEVEL.TRAFFIC, "SEND: %s", apdu.hex())
+        if logger.isEnabledFor(LOG_LEVEL.TRAFFIC):
+            logger.log(LOG_LEVEL.TRAFFIC, "SEND: %s", apdu.hex())
         data, sw1, sw2 = self.connection.transmit(list(apdu))
-        logger.log(
-            LOG_LEVEL.TRAFFIC, "RECV: %s SW=%02x%02x", bytes(data).hex(), sw1, sw2
-        )
+        if logger.isEnabledFor(LOG_LEVEL.TRAFFIC):
+            logger.log(
+                LOG_LEVEL.TRAFFIC, "RECV: %s SW=%02x%02x", bytes(data).hex(), sw1, sw2
+            )
         return bytes(data), sw1 << 8 | sw2
 
 
@@ -164,9 +166,9 @@ def list_readers():
 
 
 def list_devices(name_filter=None):
-    name_filter = YK_READER_NAME if name_filter is None else name_filter
+    name_filter = (YK_READER_NAME if name_filter is None else name_filter).lower()
     devices = []
     for reader in list_readers():
-        if name_filter.lower() in reader.name.lower():
+        if name_filter in reader.name.lower():
             devices.append(ScardYubiKeyDevice(reader))
     return devices
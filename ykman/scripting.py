@@ -139,7 +139,7 @@ def multi(
     """
     state = None
     handled_serials: Set[Optional[int]] = set()
-    pids, _ = scan_devices()
+    pids, new_state = scan_devices()
     n_devs = sum(pids.values())
     if n_devs == 0:
         if prompt:
@@ -148,7 +148,6 @@ def multi(
         raise ValueError("YubiKeys must not be present initially.")
 
     while True:  # Run this until we stop the script with Ctrl+C
-        pids, new_state = scan_devices()
         if new_state != state:
             state = new_state  # State has changed
             serials = set()
@@ -166,6 +165,7 @@ def multi(
                 sleep(1.0)  # No change, sleep for 1 second.
             except KeyboardInterrupt:
                 return  # Stop waiting
+        pids, new_state = scan_devices()
 
 
 def _get_reader(reader) -> YkmanDevice:
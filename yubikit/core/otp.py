@@ -165,11 +165,13 @@ class OtpProtocol:
             on_keepalive = lambda x: None  # noqa
         frame = _format_frame(slot, payload)
 
-        logger.log(LOG_LEVEL.TRAFFIC, "SEND: %s", frame.hex())
+        if logger.isEnabledFor(LOG_LEVEL.TRAFFIC):
+            logger.log(LOG_LEVEL.TRAFFIC, "SEND: %s", frame.hex())
         response = self._read_frame(
             self._send_frame(frame), event or Event(), on_keepalive
         )
-        logger.log(LOG_LEVEL.TRAFFIC, "RECV: %s", response.hex())
+        if logger.isEnabledFor(LOG_LEVEL.TRAFFIC):
+            logger.log(LOG_LEVEL.TRAFFIC, "RECV: %s", response.hex())
         return response
 
     def _receive(self):